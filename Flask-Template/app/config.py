@@ -16,6 +16,27 @@ class Config:
     read_DB2 = os.environ.get('read_DB2')
     write_DB2 = os.environ.get('write_DB2')
 
+    # Admission control / load shedding, applied per worker
+    ADMISSION_ENABLED = os.environ.get(
+        'ADMISSION_ENABLED', 'true').lower() == 'true'
+    ADMISSION_TARGET_DELAY_MS = int(
+        os.environ.get('ADMISSION_TARGET_DELAY_MS', 50))
+    ADMISSION_INTERVAL_MS = int(os.environ.get('ADMISSION_INTERVAL_MS', 500))
+    # Only enable when a trusted proxy overwrites X-Request-Start; sync
+    # workers have no other way to see queued requests
+    ADMISSION_TRUST_REQUEST_START = os.environ.get(
+        'ADMISSION_TRUST_REQUEST_START', 'false').lower() == 'true'
+    # Header delays above this are treated as bogus (gunicorn's default timeout)
+    ADMISSION_MAX_DELAY_MS = int(os.environ.get('ADMISSION_MAX_DELAY_MS', 30000))
+    # In-flight limits only apply to threaded workers (e.g. -k gthread)
+    ADMISSION_MAX_IN_FLIGHT = int(
+        os.environ.get('ADMISSION_MAX_IN_FLIGHT', 64))
+    ADMISSION_MIN_IN_FLIGHT = 1
+    # Share of the in-flight limit that expensive routes may occupy
+    ADMISSION_EXPENSIVE_SHARE = 0.5
+    # Routes shed first under overload (password hashing, DB writes)
+    ADMISSION_EXPENSIVE_ROUTES = ['/user/create']
+
     @staticmethod
     def log_config(logger):
         # Detailed configuration logs for debugging
@@ -1,4 +1,5 @@
 from .user_model import User
+from .user_view import UserView
 
 # export all models
-__all__ = ['User']
+__all__ = ['User', 'UserView']
@@ -1,6 +1,7 @@
 from mongoengine import Document, StringField, BooleanField, DateTimeField, ListField, EmailField, ObjectIdField
 from werkzeug.security import generate_password_hash, check_password_hash
 import datetime
+from .user_view import UserView
 
 
 class User(Document):
@@ -29,5 +30,33 @@ class User(Document):
     def password(self, password):
         self.set_password(password)
 
+    @classmethod
+    def find_views(cls, query=None, batch_size=500, include_password_hash=False):
+        """
+        Yield lists of up to batch_size UserView objects matching a raw pymongo query.
+        Bypasses Document hydration; password_hash is excluded unless requested.
+        """
+        projection = None if include_password_hash else {'password_hash': 0}
+        cursor = cls._get_collection().find(
+            query or {}, projection, batch_size=batch_size)
+
+        batch = []
+        for doc in cursor:
+            batch.append(UserView.from_son(doc))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @classmethod
+    def get_view(cls, query, include_password_hash=False):
+        """
+        Return a single UserView matching a raw pymongo query, or None.
+        """
+        projection = None if include_password_hash else {'password_hash': 0}
+        doc = cls._get_collection().find_one(query, projection)
+        return UserView.from_son(doc) if doc else None
+
     def __repr__(self):
         return f'<User {self.email}>'
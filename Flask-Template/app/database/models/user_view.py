@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+import datetime
+
+from bson import ObjectId
+
+
+@dataclass(frozen=True, slots=True)
+class UserView:
+    """
+    Read-only, slotted view of a user built straight from a raw pymongo document.
+    Skips mongoengine Document hydration, so use it for read/serialize paths only.
+    password_hash is None unless explicitly requested in the query.
+    """
+    id: ObjectId
+    email: str
+    first_name: str = ''
+    last_name: str = ''
+    is_active: bool = True
+    is_admin: bool = False
+    created_at: datetime.datetime | None = None
+    roles: tuple = ()
+    password_hash: str | None = None
+
+    @classmethod
+    def from_son(cls, doc):
+        return cls(
+            id=doc['_id'],
+            email=doc['email'],
+            first_name=doc.get('first_name', ''),
+            last_name=doc.get('last_name', ''),
+            is_active=doc.get('is_active', True),
+            is_admin=doc.get('is_admin', False),
+            created_at=doc.get('created_at'),
+            roles=tuple(doc.get('roles', ())),
+            password_hash=doc.get('password_hash'),
+        )
+
+    def to_dict(self):
+        # password_hash is never serialized
+        return {
+            'id': str(self.id),
+            'email': self.email,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'is_active': self.is_active,
+            'is_admin': self.is_admin,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'roles': list(self.roles),
+        }
+
+    def __repr__(self):
+        return f'<UserView {self.email}>'
@@ -1,8 +1,10 @@
+from .admission import setup_admission
 from .security import setup_security
 from .cors import setup_cors
 
 
 def setup_server_middleware(app):
+    setup_admission(app)  # Runs first so shed requests skip other work
     setup_security(app)
     setup_cors(app)
     # TODO: Add additional middleware setup calls here
@@ -0,0 +1,181 @@
+import math
+import threading
+import time
+
+from flask import Flask, current_app, g, jsonify, request
+
+
+def parse_request_start(header_value):
+    """
+    Parse an X-Request-Start header into epoch seconds.
+    Accepts the nginx style 't=1712345678.123' as well as bare values in
+    seconds, milliseconds or microseconds. Returns None if unparseable.
+    """
+    if not header_value:
+        return None
+    value = header_value.strip()
+    if value.startswith('t='):
+        value = value[2:]
+    try:
+        start = float(value)
+    except ValueError:
+        return None
+
+    if start > 1e14:  # microseconds
+        start /= 1e6
+    elif start > 1e11:  # milliseconds
+        start /= 1e3
+    return start if start > 0 else None
+
+
+class AdmissionController:
+    """
+    Per-worker admission control with a CoDel-style adaptive concurrency limit.
+
+    Queueing delay is read from the proxy's X-Request-Start timestamp. A sync
+    gunicorn worker serves one request at a time and cannot see requests
+    waiting in the listen backlog, so without that timestamp there is no delay
+    signal. Once the delay has stayed above the target for a whole interval
+    the controller enters the dropping state: expensive requests are shed,
+    cheap ones only when the delay passes twice the target, and the in-flight
+    limit shrinks. The limit grows back while delay stays low.
+
+    The in-flight limit only matters for threaded workers (gthread); a sync
+    worker never has more than one request in flight.
+    """
+
+    def __init__(self, target_delay, interval, max_in_flight, min_in_flight=1,
+                 expensive_share=0.5, max_delay=30.0, clock=time.monotonic,
+                 wall_clock=time.time):
+        self.target_delay = target_delay
+        self.interval = interval
+        self.max_delay = max_delay
+        self.max_in_flight = max_in_flight
+        self.min_in_flight = min_in_flight
+        self.expensive_share = expensive_share
+        self.clock = clock
+        self.wall_clock = wall_clock
+
+        self.limit = float(max_in_flight)
+        self.in_flight = 0
+        self.service_time = 0.0  # EWMA of request service time, in seconds
+        self.first_above_time = None
+        self.dropping = False
+        self._lock = threading.Lock()
+
+    def queueing_delay(self, request_start=None):
+        """Return the queueing delay in seconds for a request arriving now."""
+        if request_start is None:
+            return 0.0
+        delay = self.wall_clock() - request_start
+        if delay > self.max_delay:
+            # Implausible (bad clock or forged header), don't let it drive shedding
+            return 0.0
+        # Small negative values come from clock skew between proxy and worker
+        return max(0.0, delay)
+
+    def _update_state(self, delay, now):
+        if delay < self.target_delay:
+            self.first_above_time = None
+            self.dropping = False
+            return
+
+        if self.first_above_time is None:
+            self.first_above_time = now + self.interval
+        if now >= self.first_above_time and not self.dropping:
+            self.dropping = True
+            # Multiplicative decrease on entering the dropping state
+            self.limit = max(float(self.min_in_flight), self.limit * 0.5)
+
+    def try_acquire(self, expensive=False, request_start=None):
+        """
+        Decide whether to admit a request.
+        Returns (admitted, delay). Admitted requests must call release().
+        """
+        with self._lock:
+            delay = self.queueing_delay(request_start)
+            self._update_state(delay, self.clock())
+
+            if self.dropping and (expensive or delay >= 2 * self.target_delay):
+                return False, delay
+
+            capacity = self.limit
+            if expensive:
+                capacity = max(float(self.min_in_flight),
+                               self.limit * self.expensive_share)
+            if self.in_flight >= capacity:
+                return False, delay
+
+            self.in_flight += 1
+            return True, delay
+
+    def release(self, service_time):
+        """Record completion of an admitted request that took service_time seconds."""
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            if self.service_time == 0.0:
+                self.service_time = service_time
+            else:
+                self.service_time = 0.8 * self.service_time + 0.2 * service_time
+
+            if not self.dropping and self.limit < self.max_in_flight:
+                # Additive increase while the queue is healthy
+                self.limit = min(float(self.max_in_flight),
+                                 self.limit + 1.0 / self.limit)
+
+    def retry_after(self):
+        """Seconds a shed client should wait before retrying."""
+        return max(1, math.ceil(self.interval + self.service_time))
+
+
+def setup_admission(app: Flask):
+    if not app.config.get('ADMISSION_ENABLED', True):
+        return
+
+    controller = AdmissionController(
+        target_delay=app.config.get('ADMISSION_TARGET_DELAY_MS', 50) / 1000.0,
+        interval=app.config.get('ADMISSION_INTERVAL_MS', 500) / 1000.0,
+        max_in_flight=app.config.get('ADMISSION_MAX_IN_FLIGHT', 64),
+        min_in_flight=app.config.get('ADMISSION_MIN_IN_FLIGHT', 1),
+        expensive_share=app.config.get('ADMISSION_EXPENSIVE_SHARE', 0.5),
+        max_delay=app.config.get('ADMISSION_MAX_DELAY_MS', 30000) / 1000.0,
+    )
+    app.extensions['admission'] = controller
+    expensive_routes = set(app.config.get('ADMISSION_EXPENSIVE_ROUTES', []))
+    trust_request_start = app.config.get(
+        'ADMISSION_TRUST_REQUEST_START', False)
+
+    if not trust_request_start:
+        app.logger.warning(
+            "Admission control has no queueing delay signal: set "
+            "ADMISSION_TRUST_REQUEST_START behind a proxy that sets X-Request-Start. "
+            "Sync workers will only be protected by the in-flight limit, which "
+            "never triggers with one request per worker.")
+
+    @app.before_request
+    def admit_request():
+        rule = request.url_rule.rule if request.url_rule else request.path
+        request_start = None
+        if trust_request_start:
+            request_start = parse_request_start(
+                request.headers.get('X-Request-Start'))
+        admitted, delay = controller.try_acquire(
+            expensive=rule in expensive_routes, request_start=request_start)
+
+        if not admitted:
+            current_app.logger.warning(
+                f"Shedding {request.method} {rule}: queueing delay {delay * 1000:0.1f} ms, "
+                f"in flight {controller.in_flight}/{controller.limit:0.1f}")
+            response = jsonify(
+                {'error': 'Service is overloaded, please retry later'})
+            response.status_code = 503
+            response.headers['Retry-After'] = str(controller.retry_after())
+            return response
+
+        g.admission_started = controller.clock()
+
+    @app.teardown_request
+    def release_request(exception=None):
+        started = g.pop('admission_started', None)
+        if started is not None:
+            controller.release(controller.clock() - started)
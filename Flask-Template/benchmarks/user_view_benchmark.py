@@ -0,0 +1,55 @@
+import datetime
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+from bson import ObjectId
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.database.models import User, UserView  # noqa: E402
+
+
+def make_docs(count):
+    now = datetime.datetime.now()
+    return [{
+        '_id': ObjectId(),
+        'email': f'user{n}@example.com',
+        'password_hash': 'pbkdf2:sha256:600000$salt$' + 'a' * 64,
+        'first_name': 'First',
+        'last_name': 'Last',
+        'is_active': True,
+        'is_admin': False,
+        'created_at': now,
+        'roles': ['member'],
+    } for n in range(count)]
+
+
+def measure_memory(build, docs):
+    tracemalloc.start()
+    objects = [build(doc) for doc in docs]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / len(docs)
+
+
+def main(count=10000):
+    docs = make_docs(count)
+    builders = [
+        ('User document', User._from_son),
+        ('UserView', UserView.from_son),
+    ]
+
+    print(f"Building {count} objects from raw pymongo documents\n")
+    print(f"{'model':<16}{'us/object':>12}{'bytes/object':>16}")
+    for name, build in builders:
+        seconds = min(timeit.repeat(
+            lambda: [build(doc) for doc in docs], number=1, repeat=5))
+        per_object = measure_memory(build, docs)
+        print(f"{name:<16}{seconds / count * 1e6:>12.2f}{per_object:>16.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,162 @@
+import pytest
+import json
+import time
+from app import create_app
+from app.middleware.admission import AdmissionController, parse_request_start
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_controller(clock, **kwargs):
+    options = dict(target_delay=0.05, interval=0.5, max_in_flight=8)
+    options.update(kwargs)
+    return AdmissionController(clock=clock, wall_clock=clock, **options)
+
+
+@pytest.mark.parametrize('header, expected', [
+    ('t=1712345678.5', 1712345678.5),
+    ('1712345678500', 1712345678.5),
+    ('1712345678500000', 1712345678.5),
+    ('garbage', None),
+    (None, None),
+])
+def test_parse_request_start(header, expected):
+    assert parse_request_start(header) == expected
+
+
+def test_admits_when_delay_is_low():
+    clock = FakeClock()
+    controller = make_controller(clock)
+    admitted, delay = controller.try_acquire(request_start=clock.now - 0.01)
+    assert admitted
+    assert controller.in_flight == 1
+    controller.release(0.02)
+    assert controller.in_flight == 0
+
+
+def test_sheds_expensive_before_cheap_after_interval():
+    clock = FakeClock()
+    controller = make_controller(clock)
+    late = 0.08  # above target, below twice the target
+
+    # First sighting above target only starts the interval
+    admitted, _ = controller.try_acquire(
+        expensive=True, request_start=clock.now - late)
+    assert admitted
+    controller.release(0.01)
+
+    clock.now += 0.6
+    admitted, _ = controller.try_acquire(
+        expensive=True, request_start=clock.now - late)
+    assert not admitted
+    assert controller.dropping
+    assert controller.limit == 4
+
+    admitted, _ = controller.try_acquire(request_start=clock.now - late)
+    assert admitted
+    controller.release(0.01)
+
+    # Severe delay sheds cheap routes too
+    admitted, _ = controller.try_acquire(request_start=clock.now - 0.2)
+    assert not admitted
+    assert controller.retry_after() >= 1
+
+
+def test_recovers_when_delay_drops():
+    clock = FakeClock()
+    controller = make_controller(clock, interval=0)
+    controller.try_acquire(expensive=True, request_start=clock.now - 0.2)
+    assert controller.dropping
+
+    admitted, _ = controller.try_acquire(
+        expensive=True, request_start=clock.now)
+    assert admitted
+    assert not controller.dropping
+    limit = controller.limit
+    controller.release(0.01)
+    assert controller.limit > limit
+
+
+def test_ignores_implausible_request_start():
+    clock = FakeClock()
+    controller = make_controller(clock, interval=0, max_delay=30.0)
+
+    # Far in the past (e.g. a forged 't=1') must not trigger shedding
+    admitted, delay = controller.try_acquire(expensive=True, request_start=1.0)
+    assert admitted
+    assert delay == 0.0
+    assert not controller.dropping
+    assert controller.limit == 8
+
+    # Timestamps ahead of the worker clock count as no delay
+    admitted, delay = controller.try_acquire(request_start=clock.now + 5)
+    assert admitted
+    assert delay == 0.0
+
+
+def test_in_flight_limit_reserves_room_for_cheap_routes():
+    clock = FakeClock()
+    controller = make_controller(clock, max_in_flight=2)
+    assert controller.try_acquire(expensive=True)[0]
+    assert not controller.try_acquire(expensive=True)[0]
+    assert controller.try_acquire()[0]
+    assert not controller.try_acquire()[0]
+
+
+@pytest.fixture
+def admission_app():
+    return create_app(config_override={
+        'TESTING': True,
+        'ADMISSION_TRUST_REQUEST_START': True,
+        'ADMISSION_INTERVAL_MS': 0,
+    })
+
+
+def test_sheds_user_create_with_retry_after(admission_app):
+    client = admission_app.test_client()
+    controller = admission_app.extensions['admission']
+    response = client.post('/user/create', data=json.dumps({
+        'email': 'shed@example.com',
+        'password': 'securepassword123',
+    }), content_type='application/json', headers={
+        'X-Request-Start': f't={time.time() - 1:.3f}'
+    })
+
+    assert response.status_code == 503
+    assert 'overloaded' in response.get_json()['error']
+    assert int(response.headers['Retry-After']) >= 1
+    assert controller.dropping
+    assert controller.in_flight == 0
+
+
+def test_admitted_request_is_released(admission_app):
+    client = admission_app.test_client()
+    controller = admission_app.extensions['admission']
+    # GET is not routed on /user/create, so this never reaches the database
+    response = client.get('/user/create', headers={
+        'X-Request-Start': f't={time.time():.3f}'
+    })
+
+    assert response.status_code == 405
+    assert not controller.dropping
+    assert controller.in_flight == 0
+
+
+def test_request_start_ignored_unless_trusted():
+    app = create_app(config_override={
+        'TESTING': True,
+        'ADMISSION_INTERVAL_MS': 0,
+    })
+    client = app.test_client()
+    controller = app.extensions['admission']
+    response = client.get('/user/create', headers={'X-Request-Start': 't=1'})
+
+    assert response.status_code == 405
+    assert not controller.dropping
+    assert controller.limit == app.config['ADMISSION_MAX_IN_FLIGHT']
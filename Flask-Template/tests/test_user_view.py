@@ -0,0 +1,45 @@
+import datetime
+from bson import ObjectId
+from app.database.models import User, UserView
+from .factories import UserFactory
+
+
+def test_user_view_from_son():
+    doc = {
+        '_id': ObjectId(),
+        'email': 'view@example.com',
+        'first_name': 'View',
+        'roles': ['admin'],
+        'created_at': datetime.datetime(2024, 1, 1),
+    }
+    view = UserView.from_son(doc)
+
+    assert view.email == 'view@example.com'
+    assert view.last_name == ''
+    assert view.roles == ('admin',)
+    assert view.password_hash is None
+    assert not hasattr(view, '__dict__')
+    assert view.to_dict()['id'] == str(doc['_id'])
+    assert 'password_hash' not in view.to_dict()
+
+
+def test_find_views_excludes_password_hash(test_app):
+    user = UserFactory.create()
+
+    views = [view for batch in User.find_views({'email': user.email})
+             for view in batch]
+    assert len(views) == 1
+    assert views[0].id == user.id
+    assert views[0].password_hash is None
+
+    view = User.get_view({'_id': user.id}, include_password_hash=True)
+    assert view.password_hash == user.password_hash
+
+
+def test_find_views_batches(test_app):
+    users = UserFactory.create_batch(3)
+    emails = [user.email for user in users]
+
+    batches = list(User.find_views({'email': {'$in': emails}}, batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert sorted(view.email for batch in batches for view in batch) == sorted(emails)